@@ -18,7 +18,7 @@ class CustomHosts(_PluginBase):
     # 插件图标
     plugin_icon = "hosts.png"
     # 插件版本
-    plugin_version = "1.2.1"
+    plugin_version = "1.2.4"
     # 插件作者
     plugin_author = "thsrite"
     # 作者主页
@@ -42,11 +42,19 @@ class CustomHosts(_PluginBase):
             if isinstance(self._hosts, str):
                 self._hosts = str(self._hosts).split('\n')
             if self._enabled and self._hosts:
-                # 排除空的host
+                # 排除空的及重复的host（注释行保留）
                 new_hosts = []
+                host_set = set()
                 for host in self._hosts:
-                    if host and host != '\n':
-                        new_hosts.append(host.replace("\n", "") + "\n")
+                    host = str(host).strip() if host else ""
+                    if not host:
+                        continue
+                    host += "\n"
+                    if not host.startswith('#'):
+                        if host in host_set:
+                            continue
+                        host_set.add(host)
+                    new_hosts.append(host)
                 self._hosts = new_hosts
 
                 # 添加到系统
@@ -193,19 +201,39 @@ class CustomHosts(_PluginBase):
         # 读取系统hosts
         return Hosts(path=hosts_path)
 
-    def __clear_system_hosts(self):
+    def __read_origin_hosts(self):
         """
-        清除系统hosts
+        读取系统hosts对象，并剔除插件添加的hosts
+        :return: 剔除后的系统hosts对象，被剔除的插件hosts条目
         """
-        # 系统hosts对象
         system_hosts = self.__read_system_hosts()
-        # 过滤掉插件添加的hosts
         orgin_entries = []
-        for entry in system_hosts.entries:
+        plugin_entries = []
+        for index, entry in enumerate(system_hosts.entries):
             if entry.entry_type == "comment" and entry.comment == "# CustomHostsPlugin":
+                plugin_entries = system_hosts.entries[index:]
                 break
             orgin_entries.append(entry)
         system_hosts.entries = orgin_entries
+        return system_hosts, plugin_entries
+
+    @staticmethod
+    def __entries_key(entries) -> list:
+        """
+        生成hosts条目的比较键，忽略空行
+        """
+        return [(entry.entry_type, entry.address, entry.names, entry.comment)
+                for entry in entries if entry.entry_type != "blank"]
+
+    def __clear_system_hosts(self):
+        """
+        清除系统hosts
+        """
+        # 系统hosts对象（已过滤掉插件添加的hosts）
+        system_hosts, plugin_entries = self.__read_origin_hosts()
+        # 未添加过插件hosts则无需恢复
+        if not plugin_entries:
+            return
         try:
             system_hosts.write()
             logger.info("系统hosts文件已恢复")
@@ -218,15 +246,8 @@ class CustomHosts(_PluginBase):
         """
         添加hosts到系统
         """
-        # 系统hosts对象
-        system_hosts = self.__read_system_hosts()
-        # 过滤掉插件添加的hosts
-        orgin_entries = []
-        for entry in system_hosts.entries:
-            if entry.entry_type == "comment" and entry.comment == "# CustomHostsPlugin":
-                break
-            orgin_entries.append(entry)
-        system_hosts.entries = orgin_entries
+        # 系统hosts对象（已过滤掉插件添加的hosts）
+        system_hosts, plugin_entries = self.__read_origin_hosts()
         # 新的有效hosts
         new_entrys = []
         # 新的错误的hosts
@@ -255,11 +276,17 @@ class CustomHosts(_PluginBase):
 
         # 写入系统hosts
         if new_entrys:
+            origin_count = len(system_hosts.entries)
             try:
                 # 添加分隔标识
                 system_hosts.add([HostsEntry(entry_type='comment', comment="# CustomHostsPlugin")])
                 # 添加新的Hosts
                 system_hosts.add(new_entrys)
+                # hosts无变化时跳过写入
+                if self.__entries_key(system_hosts.entries[origin_count:]) \
+                        == self.__entries_key(plugin_entries):
+                    logger.info("系统hosts文件无变化，跳过写入")
+                    return err_flag, err_hosts
                 system_hosts.write()
                 logger.info("更新系统hosts文件成功")
             except Exception as err: